@@ -1,32 +1,34 @@
 from __future__ import annotations
 
 # :MEJORA 1: Quite imports duplicados y deje solo lo necesario.
+import builtins
+import io
 import os
+import runpy
+import shutil
+import stat
 import subprocess
 import sys
-from dataclasses import dataclass
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 # :MEJORA 2: Base dir consistente y multiplataforma.
-BASE_DIR = Path(__file__).resolve().parent
+# :MEJORA 23: abspath() no resuelve enlaces simbólicos (sin lstat por carpeta).
+BASE_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
 
+# Tamaño de bloque usado al mostrar el código de un script.
+CHUNK_SIZE = 64 * 1024
 
-# =========================
-# MODELO
-# =========================
-@dataclass(frozen=True)
-class ScriptItem:
-    """
-    Representa un script Python como un objeto.
-    #:MEJORA 3: Pasamos de strings a objetos (mejor OOP y mantenimiento).
-    """
-    path: Path
+# Niveles de carpetas que se indexan al iniciar (raíz, unidades, subcarpetas).
+INDEX_DEPTH = 3
 
-    @property
-    def name(self) -> str:
-        return self.path.name
+# Scripts de hasta este tamaño se guardan en caché al mostrarlos.
+CACHE_MAX_BYTES = 1024 * 1024
 
 
 # =========================
@@ -40,29 +42,65 @@ class ScriptRepository:
 
     def __init__(self, base_dir: Path) -> None:
         self.base_dir = base_dir
+        # ruta -> (mtime_ns, subcarpetas, scripts)
+        self._index: Dict[str, Tuple[int, List[str], List[str]]] = {}
 
-    def get_unidades(self) -> List[Path]:
-        # #:MEJORA 5: Validamos existencia y ordenamos alfabéticamente.
-        if not self.base_dir.exists():
-            return []
-        return sorted([p for p in self.base_dir.iterdir() if p.is_dir()],
-                      key=lambda x: x.name.lower())
+    def build_index(self) -> None:
+        # #:MEJORA 22: Recorremos el árbol una sola vez al iniciar (unidades,
+        #             subcarpetas y scripts); luego cada menú es una consulta.
+        self._index.clear()
+        level = [os.fspath(self.base_dir)]
+        for _ in range(INDEX_DEPTH):
+            level = [d for parent in level for d in self._lookup(parent)[1]]
 
-    def get_subcarpetas(self, unidad_dir: Path) -> List[Path]:
-        if not unidad_dir.exists():
-            return []
-        return sorted([p for p in unidad_dir.iterdir() if p.is_dir()],
-                      key=lambda x: x.name.lower())
+    def get_unidades(self) -> List[str]:
+        return self._lookup(os.fspath(self.base_dir))[1]
 
-    def get_scripts(self, carpeta_dir: Path) -> List[ScriptItem]:
-        if not carpeta_dir.exists():
-            return []
+    def get_subcarpetas(self, unidad_dir: str) -> List[str]:
+        return self._lookup(unidad_dir)[1]
 
-        scripts = sorted(
-            [p for p in carpeta_dir.iterdir() if p.is_file() and p.suffix == ".py"],
-            key=lambda x: x.name.lower()
-        )
-        return [ScriptItem(p) for p in scripts]
+    def get_scripts(self, carpeta_dir: str) -> List[str]:
+        return self._lookup(carpeta_dir)[2]
+
+    def _lookup(self, directory: str) -> Tuple[int, List[str], List[str]]:
+        # #:MEJORA 5: Validamos existencia (stat); _scan ordena alfabéticamente.
+        # Solo re-escaneamos si la carpeta cambió (su mtime es distinto).
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            self._index.pop(directory, None)
+            return (0, [], [])
+        entry = self._index.get(directory)
+        if entry is None or entry[0] != mtime:
+            entry = self._scan(directory, mtime)
+        return entry
+
+    def _scan(self, directory: str, mtime: int) -> Tuple[int, List[str], List[str]]:
+        # #:MEJORA 12: os.scandir() reutiliza los metadatos de cada entrada
+        #             (DirEntry), evitando un stat() extra por archivo.
+        # #:MEJORA 14: Ordenamos tuplas (nombre_en_minúsculas, ruta) en vez de
+        #             usar una lambda como clave.
+        # #:MEJORA 20: Devolvemos rutas como str; Path se crea solo cuando se
+        #             muestra o ejecuta un script.
+        dirs, scripts = [], []
+        try:
+            with os.scandir(directory) as it:
+                for e in it:
+                    if e.is_dir(follow_symlinks=False):
+                        # Carpetas ocultas (.git, ...) y __pycache__ no son
+                        # unidades ni subcarpetas del curso.
+                        if not (e.name.startswith(".") or e.name == "__pycache__"):
+                            dirs.append((e.name.lower(), e.path))
+                    elif e.name.endswith(".py") and e.is_file(follow_symlinks=False):
+                        scripts.append((e.name.lower(), e.path))
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            self._index.pop(directory, None)
+            return (0, [], [])
+        dirs.sort()
+        scripts.sort()
+        entry = (mtime, [p for _, p in dirs], [p for _, p in scripts])
+        self._index[directory] = entry
+        return entry
 
 
 # =========================
@@ -73,23 +111,46 @@ class ScriptViewer:
     Responsable SOLO de leer y mostrar el código.
     """
 
-    def show(self, script_path: Path) -> Optional[str]:
+    def show(self, script_path: Path) -> bool:
         # #:MEJORA 6: Leemos con UTF-8 para evitar los errores con tildes/ñ.
         try:
-            if not script_path.is_file():
+            try:
+                st = script_path.stat()
+            except FileNotFoundError:
+                st = None
+            if st is None or not stat.S_ISREG(st.st_mode):
                 print("Archivo no encontrado.")
-                return None
-
-            code = script_path.read_text(encoding="utf-8")
-            print(f"\n--- Código de {script_path.name} ---\n")
-            print(code)
-            return code
+                return False
+
+            header = f"\n--- Código de {script_path.name} ---\n\n"
+            # #:MEJORA 19: Los scripts pequeños se guardan en caché; si el
+            #             archivo cambia (mtime/tamaño) se vuelve a leer.
+            if st.st_size <= CACHE_MAX_BYTES:
+                code = _read_cached(str(script_path), st.st_mtime_ns, st.st_size)
+                # #:MEJORA 24: Encabezado y código en una sola escritura.
+                sys.stdout.write(header + code + "\n")
+                return True
+
+            sys.stdout.write(header)
+            # #:MEJORA 15: Copiamos el archivo por bloques hacia la consola,
+            #             sin cargarlo completo en memoria.
+            with script_path.open(encoding="utf-8") as f:
+                shutil.copyfileobj(f, sys.stdout, CHUNK_SIZE)
+            print()
+            return True
 
         except UnicodeDecodeError:
-            print("Error de codificación al leer el archivo (no es UTF-8).")
+            print("\nError de codificación al leer el archivo (no es UTF-8).")
         except Exception as e:
             print(f"Error al leer el archivo: {e}")
-        return None
+        return False
+
+
+@lru_cache(maxsize=32)
+def _read_cached(path: str, mtime_ns: int, size: int) -> str:
+    # mtime_ns y size solo forman parte de la clave de la caché.
+    with open(path, encoding="utf-8") as f:
+        return f.read()
 
 
 # =========================
@@ -100,21 +161,132 @@ class ScriptRunner:
     Responsable SOLO de ejecutar scripts.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, in_process: bool = os.name != "nt") -> None:
         # #:MEJORA 7: Usamos el mismo Python que ejecuta este dashboard.
         self.python = sys.executable
+        # #:MEJORA 16: En Linux/Mac ejecutamos por defecto dentro del mismo
+        #             intérprete (sin arrancar un proceso nuevo por script);
+        #             en Windows se mantiene la consola aparte.
+        self.in_process = in_process
 
-    def run(self, script_path: Path) -> None:
+    def run(self, script_path: Path, separate: bool = False) -> None:
         try:
+            if self.in_process and not separate:
+                self._run_in_process(script_path)
             # #:MEJORA 8: Ejecutamos en terminal aparte si se puede (Windows),
             #            y si no, ejecutamos en la misma consola.
-            if os.name == "nt":
+            elif os.name == "nt":
                 subprocess.Popen(["cmd", "/k", self.python, str(script_path)])
+            # #:MEJORA 28: En Linux/Mac close_fds=False permite a subprocess
+            #             usar posix_spawn (sin fork + cierre de descriptores).
             else:
-                subprocess.run([self.python, str(script_path)], check=False)
+                with subprocess.Popen([self.python, str(script_path)],
+                                      close_fds=False) as proc:
+                    code = proc.wait()
+                if code != 0:
+                    print(f"El script terminó con código {code}.")
+
+        except KeyboardInterrupt:
+            print("\nEjecución interrumpida.")
+        except Exception as e:
+            _print_script_error(e, script_path)
+
+    def run_many(self, script_paths: List[Path]) -> None:
+        # #:MEJORA 27: "Ejecutar todos" reparte los scripts entre varios
+        #             procesos (uno por núcleo como máximo).
+        if not script_paths:
+            return
+        workers = min(len(script_paths), os.cpu_count() or 1)
+        sys.stdout.flush()
+        ex = ProcessPoolExecutor(max_workers=workers)
+        try:
+            outputs = list(ex.map(_invoke, [str(p) for p in script_paths]))
+        except KeyboardInterrupt:
+            # Cancelamos lo pendiente y detenemos los procesos sin esperar
+            # a que terminen los scripts en curso.
+            processes = list((ex._processes or {}).values())
+            ex.shutdown(wait=False, cancel_futures=True)
+            for proc in processes:
+                proc.terminate()
+            for proc in processes:
+                proc.join()
+            print("\nEjecución interrumpida.")
+            return
+        except Exception as e:
+            ex.shutdown(wait=False, cancel_futures=True)
+            print(f"Error al ejecutar los scripts: {e}")
+            return
+        ex.shutdown()
+        # La salida de cada script se muestra agrupada y en el orden del menú.
+        for script_path, output in zip(script_paths, outputs):
+            sys.stdout.write(f"\n--- {script_path.name} ---\n{output}")
 
+    @staticmethod
+    def _run_in_process(script_path: Path) -> None:
+        # Guardamos el estado del proceso para que el script no altere al
+        # dashboard (argv, path, flujos estándar, carpeta actual, módulos).
+        folder = str(script_path.parent)
+        saved_argv, saved_path = sys.argv[:], sys.path[:]
+        saved_streams = sys.stdin, sys.stdout, sys.stderr
+        saved_cwd = os.getcwd()
+        saved_modules = set(sys.modules)
+        # exit()/quit() de site cierran sys.stdin antes de salir; durante el
+        # script los cambiamos por una versión que solo lanza SystemExit.
+        saved_exit = builtins.__dict__.get("exit"), builtins.__dict__.get("quit")
+        builtins.exit = builtins.quit = _script_exit
+        sys.argv = [str(script_path)]
+        sys.path.insert(0, folder)
+        try:
+            runpy.run_path(str(script_path), run_name="__main__")
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                print(f"El script terminó con código {e.code}.")
+        finally:
+            sys.argv, sys.path[:] = saved_argv, saved_path
+            sys.stdin, sys.stdout, sys.stderr = saved_streams
+            os.chdir(saved_cwd)
+            for name, func in zip(("exit", "quit"), saved_exit):
+                if func is None:
+                    builtins.__dict__.pop(name, None)
+                else:
+                    setattr(builtins, name, func)
+            # Quitamos los módulos de la carpeta del script para que otro
+            # script con módulos del mismo nombre cargue los suyos.
+            for name in set(sys.modules) - saved_modules:
+                module_file = getattr(sys.modules[name], "__file__", None) or ""
+                if module_file.startswith(folder + os.sep):
+                    del sys.modules[name]
+
+
+def _script_exit(code: object = None) -> None:
+    raise SystemExit(code)
+
+
+def _invoke(path: str) -> str:
+    # Se ejecuta en un proceso del pool, por eso es una función de módulo.
+    # Capturamos stdout/stderr para devolver la salida completa del script;
+    # no hay teclado disponible, así que stdin queda vacío.
+    out = io.StringIO()
+    sys.stdin = io.StringIO()
+    with redirect_stdout(out), redirect_stderr(out):
+        try:
+            ScriptRunner._run_in_process(Path(path))
+        except EOFError:
+            print("\nEste script pide datos con input(); ejecútelo de forma individual.")
+        except KeyboardInterrupt:
+            print("\nEjecución interrumpida.")
         except Exception as e:
-            print(f"Error al ejecutar el script: {e}")
+            _print_script_error(e, Path(path))
+    return out.getvalue()
+
+
+def _print_script_error(error: Exception, script_path: Path) -> None:
+    # Mostramos el traceback desde el script (línea del error incluida),
+    # sin los marcos internos del dashboard.
+    tb = error.__traceback__
+    while tb is not None and tb.tb_frame.f_code.co_filename != str(script_path):
+        tb = tb.tb_next
+    traceback.print_exception(type(error), error, tb or error.__traceback__)
 
 
 # =========================
@@ -125,14 +297,33 @@ class MenuUI:
     Responsable SOLO de mostrar menús y pedir opciones.
     """
 
-    def show_menu(self, title: str, options: List[str], extra: List[str]) -> str:
-        print(f"\n{title}")
-        for i, opt in enumerate(options, start=1):
-            print(f"{i} - {opt}")
-        for line in extra:
-            print(line)
+    def __init__(self) -> None:
+        # #:MEJORA 21: Si la entrada no es una terminal (pruebas, tuberías),
+        #             leemos líneas directamente de stdin en vez de input().
+        self._tty = sys.stdin.isatty()
+
+    @staticmethod
+    def render(title: str, options: List[str], extra: List[str]) -> str:
+        # #:MEJORA 18: Armamos el menú completo y lo escribimos de una sola vez.
+        buf = [f"\n{title}\n"]
+        buf.extend(f"{i} - {opt}\n" for i, opt in enumerate(options, start=1))
+        buf.extend(line + "\n" for line in extra)
+        return "".join(buf)
+
+    def prompt(self, menu: str) -> str:
+        sys.stdout.write(menu)
+        return self.ask("Seleccione una opción: ")
+
+    def ask(self, prompt: str) -> str:
         # #:MEJORA 9: strip() para evitar problemas por espacios.
-        return input("Seleccione una opción: ").strip()
+        if self._tty:
+            return input(prompt).strip()
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.strip()
 
 
 # =========================
@@ -145,23 +336,26 @@ class DashboardApp:
 
     def __init__(self, base_dir: Path) -> None:
         self.repo = ScriptRepository(base_dir)
+        self.repo.build_index()
         self.viewer = ScriptViewer()
         self.runner = ScriptRunner()
         self.ui = MenuUI()
 
     def run(self) -> None:
+        # #:MEJORA 13: Listamos una sola vez por visita al menú; una opción
+        #             inválida ya no vuelve a escanear el disco.
+        # #:MEJORA 26: El texto del menú se arma una vez y solo se vuelve a
+        #             armar si el listado cambió.
+        title, extra = "Menú Principal - Dashboard", ["0 - Salir"]
+        unidades = self.repo.get_unidades()
+        menu = self.ui.render(title, [os.path.basename(u) for u in unidades], extra)
         while True:
-            unidades = self.repo.get_unidades()
             if not unidades:
                 print("No se encontraron carpetas (unidades) en la ruta base.")
                 print(f"Ruta base actual: {self.repo.base_dir}")
                 return
 
-            choice = self.ui.show_menu(
-                "Menú Principal - Dashboard",
-                [u.name for u in unidades],
-                ["0 - Salir"]
-            )
+            choice = self.ui.prompt(menu)
 
             if choice == "0":
                 print("Saliendo del programa.")
@@ -173,19 +367,21 @@ class DashboardApp:
                 continue
 
             self._unidad_menu(unidades[idx])
-
-    def _unidad_menu(self, unidad_dir: Path) -> None:
+            latest = self.repo.get_unidades()
+            if latest is not unidades:
+                unidades = latest
+                menu = self.ui.render(title, [os.path.basename(u) for u in unidades], extra)
+
+    def _unidad_menu(self, unidad_dir: str) -> None:
+        title, extra = f"Unidad: {os.path.basename(unidad_dir)}", ["0 - Regresar"]
+        sub = self.repo.get_subcarpetas(unidad_dir)
+        menu = self.ui.render(title, [os.path.basename(s) for s in sub], extra)
         while True:
-            sub = self.repo.get_subcarpetas(unidad_dir)
             if not sub:
-                print(f"No hay subcarpetas dentro de: {unidad_dir.name}")
+                print(f"No hay subcarpetas dentro de: {os.path.basename(unidad_dir)}")
                 return
 
-            choice = self.ui.show_menu(
-                f"Unidad: {unidad_dir.name}",
-                [s.name for s in sub],
-                ["0 - Regresar"]
-            )
+            choice = self.ui.prompt(menu)
 
             if choice == "0":
                 return
@@ -196,44 +392,57 @@ class DashboardApp:
                 continue
 
             self._scripts_menu(sub[idx])
-
-    def _scripts_menu(self, carpeta_dir: Path) -> None:
+            latest = self.repo.get_subcarpetas(unidad_dir)
+            if latest is not sub:
+                sub = latest
+                menu = self.ui.render(title, [os.path.basename(s) for s in sub], extra)
+
+    def _scripts_menu(self, carpeta_dir: str) -> None:
+        title = f"Scripts en {os.path.basename(carpeta_dir)}"
+        extra = ["T - Ejecutar todos", "0 - Regresar"]
+        scripts = self.repo.get_scripts(carpeta_dir)
+        menu = self.ui.render(title, [os.path.basename(s) for s in scripts], extra)
         while True:
-            scripts = self.repo.get_scripts(carpeta_dir)
             if not scripts:
                 print("No hay scripts .py en esta carpeta.")
                 return
 
-            choice = self.ui.show_menu(
-                f"Scripts en {carpeta_dir.name}",
-                [s.name for s in scripts],
-                ["0 - Regresar"]
-            )
+            choice = self.ui.prompt(menu)
 
             if choice == "0":
                 return
 
+            if choice.upper() == "T":
+                self.runner.run_many([Path(s) for s in scripts])
+                self.ui.ask("\nPresiona Enter para continuar...")
+                continue
+
             idx = self._to_index(choice, len(scripts))
             if idx is None:
                 print("Opción inválida.")
                 continue
 
-            script_path = scripts[idx].path
+            script_path = Path(scripts[idx])
             if self.viewer.show(script_path):
-                if input("¿Ejecutar? (1=Sí / 0=No): ").strip() == "1":
-                    self.runner.run(script_path)
+                run = self.ui.ask("¿Ejecutar? (1=Sí / 2=Sí, en proceso aparte / 0=No): ")
+                if run in ("1", "2"):
+                    self.runner.run(script_path, separate=run == "2")
 
-            input("\nPresiona Enter para continuar...")
+            self.ui.ask("\nPresiona Enter para continuar...")
+            latest = self.repo.get_scripts(carpeta_dir)
+            if latest is not scripts:
+                scripts = latest
+                menu = self.ui.render(title, [os.path.basename(s) for s in scripts], extra)
 
     @staticmethod
     def _to_index(choice: str, size: int) -> Optional[int]:
         # #:MEJORA 10: Conversión segura de opción a índice.
-        try:
-            idx = int(choice) - 1
-            if 0 <= idx < size:
-                return idx
-        except ValueError:
-            pass
+        # #:MEJORA 25: Validamos los dígitos antes de int(), sin excepciones.
+        if not (choice.isascii() and choice.isdigit()):
+            return None
+        idx = int(choice) - 1
+        if 0 <= idx < size:
+            return idx
         return None
 
 